@@ -0,0 +1,13 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Post
+from .utils import POSTS_COUNT_KEY
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def reset_posts_count(**kwargs) -> None:
+    """Сбрасывает POSTS_COUNT_KEY при сохранении и удалении Post."""
+    cache.delete(POSTS_COUNT_KEY)
@@ -6,6 +6,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.conf import settings
+from django.core.cache import cache
 
 from posts.forms import Post
 from posts.models import Group, User, Comment
@@ -42,6 +43,7 @@ class PostCreateFormTests(TestCase):
         self.authorized_client = Client()
         self.authorized_client.force_login(self.user)
         self.guest_user = Client()
+        cache.clear()
 
     def test_create_post(self):
         """При отправке валидной формы со страницы создания поста
@@ -84,6 +86,21 @@ class PostCreateFormTests(TestCase):
             ).exists()
         )
 
+    def test_new_post_shown_on_profile_after_redirect(self):
+        """После создания поста автор видит его в своем профайле."""
+        profile_url = reverse('posts:profile',
+                              kwargs={'username': self.user.username})
+        self.authorized_client.get(profile_url)
+        response = self.authorized_client.post(
+            reverse('posts:post_create'),
+            data={'text': 'Свежий пост'},
+            follow=True
+        )
+        self.assertRedirects(response, profile_url)
+        self.assertContains(response, 'Свежий пост')
+        self.assertEqual(response.context['count_posts'],
+                         self.user.posts.count())
+
     def test_post_edit(self):
         """При отправке валидной формы со страницы редактирования
         поста происходит изменение поста."""
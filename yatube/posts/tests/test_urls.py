@@ -4,17 +4,21 @@ from django.urls import reverse
 from django.core.cache import cache
 
 from posts.models import Post, Group
+from posts.tests.test_views import INDEX_URL, POST_CREATE_URL
 
 User = get_user_model()
 
 
 class PostURLTests(TestCase):
     """Тестируем urls."""
+    # TestCase, а не TransactionTestCase: каждый тест откатывается
+    # транзакцией, без очистки таблиц. Тесты on_commit-хуков выносим
+    # в отдельный TransactionTestCase, не меняя базовый класс здесь.
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        cls.user = User.objects.create_user(username='auth')
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='auth')
+        cls.user = User.objects.create_user(username='HasNoName')
         cls.group = Group.objects.create(
             title='Тестовый заголовок',
             slug='test-slug',
@@ -22,26 +26,33 @@ class PostURLTests(TestCase):
         )
         cls.post = Post.objects.create(
             text='Тестовый текст',
-            author=cls.user,
+            author=cls.author,
             group=cls.group,
         )
+        cls.group_list_url = reverse('posts:group_list',
+                                     kwargs={'slug': cls.group.slug})
+        cls.profile_url = reverse('posts:profile',
+                                  kwargs={'username': cls.user.username})
+        cls.post_detail_url = reverse('posts:post_detail',
+                                      kwargs={'post_id': cls.post.id})
+        cls.post_edit_url = reverse('posts:post_edit',
+                                    kwargs={'post_id': cls.post.id})
 
     def setUp(self):
         self.guest_client = Client()
-        self.user = User.objects.create_user(username='HasNoName')
         self.authorized_client = Client()
         self.authorized_client.force_login(self.user)
         self.author_client = Client()
-        self.author_client.force_login(PostURLTests.user)
+        self.author_client.force_login(self.author)
         cache.clear()
 
     def test_url_exists_at_desired_location(self):
         """Проверка страниц, доступных любому пользователю."""
         reverse_names = [
-            reverse('posts:index'),
-            reverse('posts:group_list', kwargs={'slug': self.group.slug}),
-            reverse('posts:profile', kwargs={'username': self.user.username}),
-            reverse('posts:post_detail', kwargs={'post_id': self.post.id})
+            INDEX_URL,
+            self.group_list_url,
+            self.profile_url,
+            self.post_detail_url
         ]
         for reverse_name in reverse_names:
             with self.subTest(reverse_name=reverse_name):
@@ -51,14 +62,13 @@ class PostURLTests(TestCase):
     def test_url_for_auth_user(self):
         """Проверка страницы создания поста, доступной
         авторизированному пользователю."""
-        response = self.authorized_client.get(reverse('posts:post_create'))
+        response = self.authorized_client.get(POST_CREATE_URL)
         self.assertEqual(response.status_code, 200)
 
     def test_url_for_author(self):
         """Проверка страницы изменения поста, доступной
         автору поста."""
-        response = self.author_client.get(reverse(
-            'posts:post_edit', kwargs={'post_id': self.post.id}))
+        response = self.author_client.get(self.post_edit_url)
         self.assertEqual(response.status_code, 200)
 
     def test_page_for_404(self):
@@ -69,24 +79,12 @@ class PostURLTests(TestCase):
     def test_urls_uses_correct_template(self):
         """URL-адрес использует соответствующий шаблон."""
         templates_reverse_names = {
-            'posts/index.html': reverse('posts:index'),
-            'posts/group_list.html': reverse(
-                'posts:group_list',
-                kwargs={'slug': self.group.slug}
-            ),
-            'posts/profile.html': reverse(
-                'posts:profile',
-                kwargs={'username': self.user.username}
-            ),
-            'posts/post_detail.html': reverse(
-                'posts:post_detail',
-                kwargs={'post_id': self.post.id}
-            ),
-            'posts/create_post.html': reverse('posts:post_create'),
-            'posts/update_post.html': reverse(
-                'posts:post_edit',
-                kwargs={'post_id': self.post.id}
-            ),
+            'posts/index.html': INDEX_URL,
+            'posts/group_list.html': self.group_list_url,
+            'posts/profile.html': self.profile_url,
+            'posts/post_detail.html': self.post_detail_url,
+            'posts/create_post.html': POST_CREATE_URL,
+            'posts/update_post.html': self.post_edit_url,
         }
         for template, reverse_names in templates_reverse_names.items():
             with self.subTest(reverse_names=reverse_names):
@@ -9,19 +9,23 @@ from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.cache import cache
 
-from posts.models import Post, Group
+from posts.models import Comment, Post, Group
 
 User = get_user_model()
 
 TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
 
+INDEX_URL = reverse('posts:index')
+POST_CREATE_URL = reverse('posts:post_create')
+
 
 @override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
 class PostViewsTests(TestCase):
+    # Данные из setUpTestData откатываются транзакцией TestCase;
+    # TransactionTestCase с очисткой таблиц здесь не нужен.
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         small_gif = (
             b'\x47\x49\x46\x38\x39\x61\x02\x00'
             b'\x01\x00\x80\x00\x00\x00\x00\x00'
@@ -47,6 +51,14 @@ class PostViewsTests(TestCase):
             group=cls.group,
             image=cls.uploaded
         )
+        cls.group_list_url = reverse('posts:group_list',
+                                     kwargs={'slug': cls.group.slug})
+        cls.profile_url = reverse('posts:profile',
+                                  kwargs={'username': cls.user.username})
+        cls.post_detail_url = reverse('posts:post_detail',
+                                      kwargs={'post_id': cls.post.id})
+        cls.post_edit_url = reverse('posts:post_edit',
+                                    kwargs={'post_id': cls.post.id})
 
     @classmethod
     def tearDownClass(cls):
@@ -64,20 +76,12 @@ class PostViewsTests(TestCase):
     def test_post_uses_correct_template(self):
         """URL-адрес использует соответствующий шаблон."""
         templates_pages_names = {
-            'posts/index.html': reverse('posts:index'),
-            'posts/profile.html': (
-                reverse('posts:profile',
-                        kwargs={'username': self.user.username})),
-            'posts/group_list.html': (
-                reverse('posts:group_list',
-                        kwargs={'slug': self.group.slug})),
-            'posts/create_post.html': reverse('posts:post_create'),
-            'posts/post_detail.html': (
-                reverse('posts:post_detail',
-                        kwargs={'post_id': self.post.id})),
-            'posts/update_post.html': (
-                reverse('posts:post_edit',
-                        kwargs={'post_id': self.post.id})),
+            'posts/index.html': INDEX_URL,
+            'posts/profile.html': self.profile_url,
+            'posts/group_list.html': self.group_list_url,
+            'posts/create_post.html': POST_CREATE_URL,
+            'posts/post_detail.html': self.post_detail_url,
+            'posts/update_post.html': self.post_edit_url,
         }
         for template, reverse_name in templates_pages_names.items():
             with self.subTest(reverse_name=reverse_name):
@@ -88,9 +92,9 @@ class PostViewsTests(TestCase):
         """Шаблоны index group_list profile сформированы
         с правильным контекстом."""
         reverse_names = [
-            reverse('posts:index'),
-            reverse('posts:group_list', kwargs={'slug': self.group.slug}),
-            reverse('posts:profile', kwargs={'username': self.user.username})
+            INDEX_URL,
+            self.group_list_url,
+            self.profile_url
         ]
         for reverse_name in reverse_names:
             with self.subTest(reverse_name=reverse_name):
@@ -107,8 +111,7 @@ class PostViewsTests(TestCase):
 
     def test_post_detail_shows_correct_context(self):
         """Шаблон post_detail сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse(
-            'posts:post_detail', kwargs={'post_id': self.post.id}))
+        response = self.authorized_client.get(self.post_detail_url)
         post_0 = response.context.get('post')
         text_0 = post_0.text
         author_0 = post_0.author
@@ -119,9 +122,23 @@ class PostViewsTests(TestCase):
         self.assertEqual(group_0, self.group)
         self.assertEqual(post_image_0, self.post.image)
 
+    def test_profile_post_detail_show_count_posts(self):
+        """Шаблоны profile и post_detail получают число постов автора."""
+        Post.objects.create(text='Второй пост', author=self.user)
+        Comment.objects.create(text='Комментарий', author=self.user,
+                               post=self.post)
+        reverse_names = [
+            self.profile_url,
+            self.post_detail_url
+        ]
+        for reverse_name in reverse_names:
+            with self.subTest(reverse_name=reverse_name):
+                response = self.authorized_client.get(reverse_name)
+                self.assertEqual(response.context['count_posts'], 2)
+
     def test_post_create_show_correct_context(self):
         """Шаблон post_create сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse('posts:post_create'))
+        response = self.authorized_client.get(POST_CREATE_URL)
         form_fields = {
             'text': forms.fields.CharField,
             'group': forms.fields.ChoiceField
@@ -134,8 +151,7 @@ class PostViewsTests(TestCase):
 
     def test_post_edit_show_correct_context(self):
         """Шаблон post_edit сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse(
-            'posts:post_edit', kwargs={'post_id': self.post.id}))
+        response = self.authorized_client.get(self.post_edit_url)
         form_fields = {
             'text': forms.fields.CharField,
             'group': forms.fields.ChoiceField
@@ -149,9 +165,9 @@ class PostViewsTests(TestCase):
     def test_post_appeared_in_index_group_list_profile(self):
         """Пост появляется на страницах сайта."""
         reverse_names = [
-            reverse('posts:index'),
-            reverse('posts:group_list', kwargs={'slug': self.group.slug}),
-            reverse('posts:profile', kwargs={'username': self.user.username})
+            INDEX_URL,
+            self.group_list_url,
+            self.profile_url
         ]
         for reverse_name in reverse_names:
             with self.subTest(reverse_name=reverse_name):
@@ -160,8 +176,7 @@ class PostViewsTests(TestCase):
 
     def test_post_didnot_appear_on_the_other_groups_page(self):
         """Пост не попал в группу, для которой не был предназначен."""
-        response = self.authorized_client.get(reverse(
-            'posts:group_list', kwargs={'slug': self.group.slug}))
+        response = self.authorized_client.get(self.group_list_url)
         self.assertIsNot(self.post, response.context['page_obj'])
 
     def test_cache(self):
@@ -170,33 +185,34 @@ class PostViewsTests(TestCase):
             text='Кэш текст',
             author=self.user,
             group=self.group,)
-        page_index = self.authorized_client.get(
-            reverse('posts:index')).content
+        page_index = self.authorized_client.get(INDEX_URL).content
         post_1.delete()
-        page_delete = self.authorized_client.get(
-            reverse('posts:index')).content
+        page_delete = self.authorized_client.get(INDEX_URL).content
         self.assertEqual(page_index, page_delete)
         cache.clear()
-        page_cache_clear = self.authorized_client.get(
-            reverse('posts:index')).content
+        page_cache_clear = self.authorized_client.get(INDEX_URL).content
         self.assertNotEqual(page_index, page_cache_clear)
 
 
 class PaginatorViewsTest(TestCase):
+    # Откат транзакцией TestCase, без TRUNCATE между тестами.
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='TestUser')
         cls.group = Group.objects.create(
             title='Тестовый заголовок',
             slug='test-slug',
             description='Тестовое описание'
         )
-        for i in range(13):
-            Post.objects.create(author=cls.user,
-                                group=cls.group,
-                                text=f'Пост {i}')
+        Post.objects.bulk_create([
+            Post(author=cls.user, group=cls.group, text=f'Пост {i}')
+            for i in range(13)
+        ])
+        cls.group_list_url = reverse('posts:group_list',
+                                     kwargs={'slug': cls.group.slug})
+        cls.profile_url = reverse('posts:profile',
+                                  kwargs={'username': cls.user.username})
 
     def setUp(self):
         self.guest_client = Client()
@@ -204,14 +220,26 @@ class PaginatorViewsTest(TestCase):
 
     def test_paginator(self):
         """Проверка количества постов на странице."""
-        url_pages = [
-            reverse('posts:index'),
-            reverse('posts:group_list', kwargs={'slug': self.group.slug}),
-            reverse('posts:profile', kwargs={'username': self.user.username}),
-        ]
-        for url in url_pages:
+        # Число запросов на первой и второй странице: index берет
+        # COUNT из кеша после первого обращения, group_list и profile
+        # считают посты в запросе группы или автора.
+        url_pages = {
+            INDEX_URL: (2, 1),
+            self.group_list_url: (2, 2),
+            self.profile_url: (2, 2),
+        }
+        for url, (first_queries, second_queries) in url_pages.items():
             with self.subTest(url=url):
-                response = self.guest_client.get(url)
+                with self.assertNumQueries(first_queries):
+                    response = self.guest_client.get(url)
                 self.assertEqual(len(response.context['page_obj']), 10)
-                response = self.guest_client.get(url + '?page=2')
+                with self.assertNumQueries(second_queries):
+                    response = self.guest_client.get(url + '?page=2')
                 self.assertEqual(len(response.context['page_obj']), 3)
+
+    def test_paginator_count_reset_on_new_post(self):
+        """Новый пост учитывается в пагинаторе главной страницы."""
+        self.guest_client.get(INDEX_URL)
+        Post.objects.create(author=self.user, text='Новый пост')
+        response = self.guest_client.get(INDEX_URL + '?page=2')
+        self.assertEqual(len(response.context['page_obj']), 4)
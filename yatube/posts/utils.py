@@ -0,0 +1,30 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+
+from .models import Post
+
+POSTS_COUNT_KEY = 'post_count:all'
+# Кеш главной страницы и числа постов на ней живут одинаково.
+INDEX_CACHE_TIMEOUT = 20
+
+
+class CountedPaginator(Paginator):
+    """Пагинатор с заранее известным числом объектов.
+
+    Не делает отдельный запрос COUNT(*) к базе.
+    """
+
+    def __init__(self, object_list, per_page, count: int, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+
+def get_posts_count() -> int:
+    """Число всех постов, закешированное на INDEX_CACHE_TIMEOUT секунд.
+
+    Может отставать от реального: сигнал сбрасывает ключ только в кеше
+    процесса, сохранившего пост, а bulk_create и QuerySet.update
+    сигналов не отправляют.
+    """
+    return cache.get_or_set(POSTS_COUNT_KEY, Post.objects.count,
+                            INDEX_CACHE_TIMEOUT)
@@ -1,23 +1,27 @@
-from datetime import datetime
-
-from django.core.paginator import Paginator
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
 from django.conf import settings
+from django.db.models import Count
 from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 from .models import Post, Group, User
 from .forms import PostForm, CommentForm
+from .utils import CountedPaginator, INDEX_CACHE_TIMEOUT, get_posts_count
+
+PAGE_SIZE = settings.PAGE
 
 
-@cache_page(20)
+@cache_page(INDEX_CACHE_TIMEOUT)
+@vary_on_cookie
 def index(request: HttpRequest) -> HttpResponse:
     """Функция для главной страницы.
     """
     template = 'posts/index.html'
-    post_list = Post.objects.all()
-    paginator = Paginator(post_list, settings.PAGE)
+    post_list = Post.objects.select_related('author', 'group').all()
+    paginator = CountedPaginator(post_list, PAGE_SIZE,
+                                 count=get_posts_count())
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     title = 'Последние обновления на сайте'
@@ -32,15 +36,16 @@ def group_posts(request: HttpRequest, slug: str) -> HttpResponse:
     """Функция для записей сообщества.
     """
     template = 'posts/group_list.html'
-    group = get_object_or_404(Group, slug=slug)
-    posts = Post.objects.filter(group=group)
-    paginator = Paginator(posts, settings.PAGE)
+    group = get_object_or_404(
+        Group.objects.annotate(count_posts=Count('posts')), slug=slug
+    )
+    posts = group.posts.select_related('author').all()
+    paginator = CountedPaginator(posts, PAGE_SIZE, count=group.count_posts)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     title = f'Записи сообщества {group}'
     context = {
         'group': group,
-        'posts': posts,
         'page_obj': page_obj,
         'title': title,
     }
@@ -51,17 +56,17 @@ def profile(request: HttpRequest, username: str) -> HttpResponse:
     """Функция для профайла пользователя.
     """
     template = 'posts/profile.html'
-    author = get_object_or_404(User, username=username)
-    posts = author.posts.all()
-    count_posts = author.posts.count()
-    paginator = Paginator(posts, settings.PAGE)
+    author = get_object_or_404(
+        User.objects.annotate(count_posts=Count('posts')), username=username
+    )
+    posts = author.posts.select_related('group').all()
+    paginator = CountedPaginator(posts, PAGE_SIZE, count=author.count_posts)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     title = f'Профайл пользователя {author}'
     context = {
         'author': author,
-        'posts': posts,
-        'count_posts': count_posts,
+        'count_posts': author.count_posts,
         'page_obj': page_obj,
         'title': title,
     }
@@ -72,11 +77,14 @@ def post_detail(request: HttpRequest, post_id: int) -> HttpResponse:
     """Функция для просмотра записи.
     """
     template = 'posts/post_detail.html'
-    post = get_object_or_404(Post, id=post_id)
+    post = get_object_or_404(
+        Post.objects.select_related('author', 'group').annotate(
+            count_posts=Count('author__posts')
+        ),
+        id=post_id
+    )
     group = post.group
-    author = post.author
-    count_posts = author.posts.count()
-    comments = post.comments.all()
+    comments = post.comments.select_related('author')
     form = CommentForm()
     title = f'Пост {post.text[:30]}'
     context = {
@@ -84,7 +92,7 @@ def post_detail(request: HttpRequest, post_id: int) -> HttpResponse:
         'comments': comments,
         'post': post,
         'group': group,
-        'count_posts': count_posts,
+        'count_posts': post.count_posts,
         'title': title,
     }
     return render(request, template, context)
@@ -103,10 +111,7 @@ def post_create(request: HttpRequest) -> HttpResponse:
             'title': title,
         }
         return render(request, template, context)
-    form = PostForm(
-        request.POST or None,
-        files=request.FILES or None
-    )
+    form = PostForm(request.POST, files=request.FILES)
     if not form.is_valid():
         context = {
             'form': form,
@@ -115,7 +120,6 @@ def post_create(request: HttpRequest) -> HttpResponse:
         return render(request, template, context)
     post = form.save(commit=False)
     post.author = request.user
-    post.pub_date = datetime.now()
     post.save()
     return redirect('posts:profile', request.user)
 
@@ -125,10 +129,14 @@ def post_edit(request: HttpRequest, post_id: int) -> HttpResponse:
     """Функция для редактирования постов.
     """
     template = 'posts/update_post.html'
-    post = get_object_or_404(Post, id=post_id, author=request.user)
+    post = get_object_or_404(
+        Post.objects.only('text', 'group', 'image', 'author'),
+        id=post_id,
+        author=request.user
+    )
     title = f'Редактрирование поста {post.id}'
-    form = PostForm(instance=post)
     if request.method != 'POST':
+        form = PostForm(instance=post)
         context = {
             'form': form,
             'is_edit': True,
@@ -136,11 +144,7 @@ def post_edit(request: HttpRequest, post_id: int) -> HttpResponse:
             'title': title,
         }
         return render(request, template, context)
-    form = PostForm(
-        request.POST or None,
-        files=request.FILES or None,
-        instance=post
-    )
+    form = PostForm(request.POST, files=request.FILES, instance=post)
     if not form.is_valid():
         context = {
             'form': form,
@@ -150,7 +154,6 @@ def post_edit(request: HttpRequest, post_id: int) -> HttpResponse:
         return render(request, template, context)
     post = form.save(commit=False)
     post.author = request.user
-    post.pub_date = datetime.now()
     post.save()
     return redirect('posts:post_detail', post.id)
 
@@ -0,0 +1,27 @@
+"""
+Django settings for running the yatube test suite.
+
+Usage: DJANGO_SETTINGS_MODULE=yatube.test_settings python manage.py test
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+# Hashing passwords with PBKDF2 is deliberately slow; tests don't need it.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# A file-backed test database, so --keepdb / --reuse-db can keep it
+# between runs (an in-memory SQLite database vanishes with the process).
+DATABASES['default']['TEST'] = {  # noqa: F405
+    'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3'),  # noqa: F405
+}
+
+# Fail tests on lazy loads of related objects (N+1 queries).
+INSTALLED_APPS = INSTALLED_APPS + ['nplusone.ext.django']  # noqa: F405
+MIDDLEWARE = [
+    'nplusone.ext.django.NPlusOneMiddleware',
+] + MIDDLEWARE  # noqa: F405
+NPLUSONE_RAISE = True